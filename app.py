@@ -1,9 +1,14 @@
-from flask import Flask, jsonify, render_template_string, request
+import os
+
+from flask import Flask, jsonify, render_template, request
+from jinja2 import DictLoader
 import requests
 
+import similar
+
 app = Flask(__name__)
 
-BASE_URL = "https://www.themealdb.com/api/json/v1/1/"
+BASE_URL = os.environ.get("MEALDB_BASE_URL", "https://www.themealdb.com/api/json/v1/1/")
 
 # Enhanced HTML template with beautiful meal cards and layouts
 HTML_TEMPLATE = """
@@ -322,6 +327,30 @@ HTML_TEMPLATE = """
             font-style: italic;
         }
         
+        /* Similar meals panel */
+        .similar-meals {
+            margin: 10px 0 40px;
+        }
+        
+        .similar-meals h4 {
+            color: #333;
+            font-size: 1.3em;
+        }
+        
+        .similar-meals .meals-grid {
+            grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
+            gap: 20px;
+        }
+        
+        .similar-meals .meal-image {
+            height: 140px;
+        }
+        
+        .meal-card-link {
+            text-decoration: none;
+            color: inherit;
+        }
+        
         /* Responsive Design */
         @media (max-width: 768px) {
             .meal-detail {
@@ -501,6 +530,27 @@ HTML_TEMPLATE = """
                                     {% endif %}
                                 </div>
                             </div>
+                            
+                            {% set similar = similar_meals(meal.idMeal) %}
+                            {% if similar %}
+                            <div class="similar-meals">
+                                <h4><i class="fas fa-utensils"></i> Similar Meals</h4>
+                                <div class="meals-grid">
+                                    {% for other in similar %}
+                                    <a href="/meal/{{ other.idMeal }}" class="meal-card-link">
+                                        <div class="meal-card">
+                                            <img src="{{ other.strMealThumb }}" alt="{{ other.strMeal }}" class="meal-image">
+                                            <div class="meal-info">
+                                                <h3 class="meal-title">{{ other.strMeal }}</h3>
+                                                {% if other.strCategory %}<span class="meal-category">{{ other.strCategory }}</span>{% endif %}
+                                                {% if other.strArea %}<span class="meal-area">{{ other.strArea }}</span>{% endif %}
+                                            </div>
+                                        </div>
+                                    </a>
+                                    {% endfor %}
+                                </div>
+                            </div>
+                            {% endif %}
                             {% endfor %}
                         {% else %}
                             <!-- Meal cards grid for search results -->
@@ -567,9 +617,13 @@ HTML_TEMPLATE = """
 </html>
 """
 
-def fetch_data(endpoint, params=None):
+# Serve HTML_TEMPLATE by name so Jinja compiles it once instead of per request
+TEMPLATE_LOADER = DictLoader({"index.html": HTML_TEMPLATE})
+app.jinja_loader = TEMPLATE_LOADER
+
+def fetch_data(endpoint, params=None, timeout=None):
     try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
+        response = requests.get(f"{BASE_URL}{endpoint}", params=params, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -584,103 +638,133 @@ def fetch_data(endpoint, params=None):
             content = response.text
         return {"error": "Failed to decode JSON from response.", "content": content}
 
-@app.route('/')
-def home():
-    return render_template_string(HTML_TEMPLATE, title="🍽️ Welcome to MealDB Explorer!", 
-                                message="Discover amazing recipes from around the world! Use the navigation above to search for meals, explore categories, or try a random recipe.")
+@app.context_processor
+def similar_meals_helper():
+    def similar_meals(meal_id):
+        # Suggestions appear once the catalog has been indexed in the background
+        index = similar.get_index(fetch_data)
+        return index.similar_to(meal_id) if index is not None else []
+    return {"similar_meals": similar_meals}
+
+# --- Views ---
+# Each view maps the query string to the template context and, when the page
+# shows TheMealDB data, the (endpoint, params) to fetch into `data`. They are
+# served by the Flask app below and by the async app in asgi.py.
+VIEWS = []
+
+def view(rule):
+    def register(func):
+        VIEWS.append((rule, func))
+        return func
+    return register
+
+def page(upstream=None, **context):
+    return context, upstream
+
+@view('/')
+def home(args):
+    return page(title="🍽️ Welcome to MealDB Explorer!", 
+                message="Discover amazing recipes from around the world! Use the navigation above to search for meals, explore categories, or try a random recipe.")
 
 # --- Forms for user input ---
-@app.route('/search_meal_by_name_form')
-def search_meal_by_name_form():
-    return render_template_string(HTML_TEMPLATE, title="🔍 Search Meal by Name", 
-                                show_search_meal_by_name_form=True, 
-                                message="Enter a meal name to find delicious recipes!")
-
-@app.route('/list_meals_by_first_letter_form')
-def list_meals_by_first_letter_form():
-    return render_template_string(HTML_TEMPLATE, title="📝 List Meals by First Letter", 
-                                show_list_meals_by_first_letter_form=True, 
-                                message="Browse meals alphabetically by their first letter!")
-
-@app.route('/filter_by_main_ingredient_form')
-def filter_by_main_ingredient_form():
-    return render_template_string(HTML_TEMPLATE, title="🥕 Filter by Main Ingredient", 
-                                show_filter_by_main_ingredient_form=True, 
-                                message="Find meals that use your favorite ingredient!")
-
-@app.route('/filter_by_category_form')
-def filter_by_category_form():
-    return render_template_string(HTML_TEMPLATE, title="🏷️ Filter by Category", 
-                                show_filter_by_category_form=True, 
-                                message="Explore meals by category like Dessert, Seafood, or Vegetarian.")
-
-@app.route('/filter_by_area_form')
-def filter_by_area_form():
-    return render_template_string(HTML_TEMPLATE, title="🌍 Filter by Area", 
-                                show_filter_by_area_form=True, 
-                                message="Discover authentic cuisine from different countries and regions!")
+@view('/search_meal_by_name_form')
+def search_meal_by_name_form(args):
+    return page(title="🔍 Search Meal by Name", 
+                show_search_meal_by_name_form=True, 
+                message="Enter a meal name to find delicious recipes!")
+
+@view('/list_meals_by_first_letter_form')
+def list_meals_by_first_letter_form(args):
+    return page(title="📝 List Meals by First Letter", 
+                show_list_meals_by_first_letter_form=True, 
+                message="Browse meals alphabetically by their first letter!")
+
+@view('/filter_by_main_ingredient_form')
+def filter_by_main_ingredient_form(args):
+    return page(title="🥕 Filter by Main Ingredient", 
+                show_filter_by_main_ingredient_form=True, 
+                message="Find meals that use your favorite ingredient!")
+
+@view('/filter_by_category_form')
+def filter_by_category_form(args):
+    return page(title="🏷️ Filter by Category", 
+                show_filter_by_category_form=True, 
+                message="Explore meals by category like Dessert, Seafood, or Vegetarian.")
+
+@view('/filter_by_area_form')
+def filter_by_area_form(args):
+    return page(title="🌍 Filter by Area", 
+                show_filter_by_area_form=True, 
+                message="Discover authentic cuisine from different countries and regions!")
 
 # --- API Routes ---
-@app.route('/search_meal_by_name')
-def search_meal_by_name():
-    meal_name = request.args.get('name')
+@view('/search_meal_by_name')
+def search_meal_by_name(args):
+    meal_name = args.get('name')
     if not meal_name:
-        return render_template_string(HTML_TEMPLATE, title="🔍 Search Meal by Name", 
-                                    message="Error: Meal name is required.", 
-                                    show_search_meal_by_name_form=True)
-    data = fetch_data("search.php", params={"s": meal_name})
-    return render_template_string(HTML_TEMPLATE, title=f"🔍 Search Results for: {meal_name}", data=data)
-
-@app.route('/list_meals_by_first_letter')
-def list_meals_by_first_letter():
-    first_letter = request.args.get('letter')
+        return page(title="🔍 Search Meal by Name", 
+                    message="Error: Meal name is required.", 
+                    show_search_meal_by_name_form=True)
+    return page(("search.php", {"s": meal_name}), title=f"🔍 Search Results for: {meal_name}")
+
+@view('/list_meals_by_first_letter')
+def list_meals_by_first_letter(args):
+    first_letter = args.get('letter')
     if not first_letter or len(first_letter) != 1:
-        return render_template_string(HTML_TEMPLATE, title="📝 List Meals by First Letter", 
-                                    message="Error: A single first letter is required.", 
-                                    show_list_meals_by_first_letter_form=True)
-    data = fetch_data("search.php", params={"f": first_letter})
-    return render_template_string(HTML_TEMPLATE, title=f"📝 Meals Starting With: {first_letter.upper()}", data=data)
-
-@app.route('/random_meal')
-def random_meal():
-    data = fetch_data("random.php")
-    return render_template_string(HTML_TEMPLATE, title="🎲 Random Meal Discovery", data=data)
-
-@app.route('/filter_by_main_ingredient')
-def filter_by_main_ingredient():
-    ingredient = request.args.get('ingredient')
+        return page(title="📝 List Meals by First Letter", 
+                    message="Error: A single first letter is required.", 
+                    show_list_meals_by_first_letter_form=True)
+    return page(("search.php", {"f": first_letter}), title=f"📝 Meals Starting With: {first_letter.upper()}")
+
+@view('/random_meal')
+def random_meal(args):
+    return page(("random.php", None), title="🎲 Random Meal Discovery")
+
+@view('/meal/<meal_id>')
+def meal_details(args, meal_id):
+    return page(("lookup.php", {"i": meal_id}), title="🍽️ Meal Details")
+
+@view('/filter_by_main_ingredient')
+def filter_by_main_ingredient(args):
+    ingredient = args.get('ingredient')
     if not ingredient:
-        return render_template_string(HTML_TEMPLATE, title="🥕 Filter by Main Ingredient", 
-                                    message="Error: Ingredient name is required.", 
-                                    show_filter_by_main_ingredient_form=True)
-    data = fetch_data("filter.php", params={"i": ingredient})
-    return render_template_string(HTML_TEMPLATE, 
-                                title=f"🥕 Meals with {ingredient.replace('_', ' ').title()}", 
-                                data=data)
-
-@app.route('/filter_by_category')
-def filter_by_category():
-    category = request.args.get('category')
+        return page(title="🥕 Filter by Main Ingredient", 
+                    message="Error: Ingredient name is required.", 
+                    show_filter_by_main_ingredient_form=True)
+    return page(("filter.php", {"i": ingredient}), 
+                title=f"🥕 Meals with {ingredient.replace('_', ' ').title()}")
+
+@view('/filter_by_category')
+def filter_by_category(args):
+    category = args.get('category')
     if not category:
-        return render_template_string(HTML_TEMPLATE, title="🏷️ Filter by Category", 
-                                    message="Error: Category name is required.", 
-                                    show_filter_by_category_form=True)
-    data = fetch_data("filter.php", params={"c": category})
-    return render_template_string(HTML_TEMPLATE, 
-                                title=f"🏷️ {category} Meals", 
-                                data=data)
-
-@app.route('/filter_by_area')
-def filter_by_area():
-    area = request.args.get('area')
+        return page(title="🏷️ Filter by Category", 
+                    message="Error: Category name is required.", 
+                    show_filter_by_category_form=True)
+    return page(("filter.php", {"c": category}), 
+                title=f"🏷️ {category} Meals")
+
+@view('/filter_by_area')
+def filter_by_area(args):
+    area = args.get('area')
     if not area:
-        return render_template_string(HTML_TEMPLATE, title="🌍 Filter by Area", 
-                                    message="Error: Area name is required.", 
-                                    show_filter_by_area_form=True)
-    data = fetch_data("filter.php", params={"a": area})
-    return render_template_string(HTML_TEMPLATE, 
-                                title=f"🌍 {area} Cuisine", 
-                                data=data)
+        return page(title="🌍 Filter by Area", 
+                    message="Error: Area name is required.", 
+                    show_filter_by_area_form=True)
+    return page(("filter.php", {"a": area}), 
+                title=f"🌍 {area} Cuisine")
+
+def serve(view_func):
+    def handler(**path_args):
+        context, upstream = view_func(request.args, **path_args)
+        if upstream:
+            endpoint, params = upstream
+            context["data"] = fetch_data(endpoint, params=params)
+        return render_template("index.html", **context)
+    return handler
+
+for rule, view_func in VIEWS:
+    app.add_url_rule(rule, view_func.__name__, serve(view_func))
 
 if __name__ == '__main__':
     app.run(debug=True, port=5001)
\ No newline at end of file
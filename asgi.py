@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+import json
+
+import aiohttp
+from quart import Quart, render_template, request
+
+import similar
+from app import BASE_URL, TEMPLATE_LOADER, VIEWS
+
+# Async serving mode: the same views and template as app.py, but upstream calls
+# are awaited so one process keeps many slow TheMealDB requests in flight.
+# Run with `hypercorn asgi:app`, `uvicorn asgi:app` or `python asgi.py`.
+
+# Upper bound on concurrent connections to TheMealDB (aiohttp defaults to 100)
+MAX_UPSTREAM_CONNECTIONS = 1000
+UPSTREAM_TIMEOUT = 30.0
+
+app = Quart(__name__)
+app.jinja_loader = TEMPLATE_LOADER
+
+client = None
+index_task = None
+
+
+async def fetch_data(endpoint, params=None, timeout=None):
+    content = 'No content returned'
+    # An explicit timeout=None would disable aiohttp's limit, so always pass one
+    request_timeout = aiohttp.ClientTimeout(total=timeout or UPSTREAM_TIMEOUT)
+    try:
+        async with client.get(f"{BASE_URL}{endpoint}", params=params,
+                              timeout=request_timeout) as response:
+            response.raise_for_status()
+            content = await response.text()
+            return json.loads(content)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # Attempt to get status code from response if available
+        status_code = 'N/A'
+        if isinstance(e, aiohttp.ClientResponseError):
+            status_code = e.status
+        return {"error": str(e) or type(e).__name__, "status_code": status_code}
+    except ValueError: # If response is not JSON
+        return {"error": "Failed to decode JSON from response.", "content": content}
+
+
+async def build_similar_index():
+    index = None
+    try:
+        meals = await similar.load_catalog_async(fetch_data)
+        # Ranking is CPU-bound; keep it off the event loop
+        index = await asyncio.to_thread(similar.SimilarMealIndex.build, meals)
+    except similar.CatalogError:
+        pass
+    finally:
+        similar.finish_build(index)
+
+
+def ensure_similar_index():
+    # Build in the background; pages render without suggestions until it is ready
+    global index_task
+    if similar.claim_build():
+        index_task = asyncio.get_running_loop().create_task(build_similar_index())
+
+
+@app.before_serving
+async def open_client():
+    global client
+    client = aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=UPSTREAM_TIMEOUT),
+        connector=aiohttp.TCPConnector(limit=MAX_UPSTREAM_CONNECTIONS),
+    )
+    ensure_similar_index()
+
+
+@app.after_serving
+async def close_client():
+    if index_task is not None:
+        index_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await index_task
+    await client.close()
+
+
+@app.context_processor
+async def similar_meals_helper():
+    def similar_meals(meal_id):
+        index = similar.current_index()
+        if index is None:
+            ensure_similar_index()
+            return []
+        return index.similar_to(meal_id)
+    return {"similar_meals": similar_meals}
+
+
+def serve(view_func):
+    async def handler(**path_args):
+        context, upstream = view_func(request.args, **path_args)
+        if upstream:
+            endpoint, params = upstream
+            context["data"] = await fetch_data(endpoint, params=params)
+        return await render_template("index.html", **context)
+    return handler
+
+
+for rule, view_func in VIEWS:
+    app.add_url_rule(rule, view_func.__name__, serve(view_func))
+
+if __name__ == '__main__':
+    app.run(debug=True, port=5001)
@@ -0,0 +1,219 @@
+"""Compare sync (Flask) and async (asgi.py) serving against a slow stub upstream.
+
+Usage: python benchmarks/bench_async.py [--latency 0.2] [--requests 2000]
+                                        [--concurrency 300] [--sync-workers 8]
+
+Each mode runs in its own process with MEALDB_BASE_URL pointed at a local stub
+that sleeps `--latency` seconds per call and records how many calls it is
+serving at once. The sync mode serves app.py from a fixed pool of worker
+threads, like a WSGI server with `--sync-workers` workers; the async mode runs
+asgi.py in a single uvicorn process.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PAGE = "/filter_by_category?category=Seafood"
+# A detail page that shows the similar meals panel once the index is built
+WARMUP_PAGE = "/meal/52900"
+STUB_MEALS = {"meals": [
+    {"idMeal": str(52900 + i), "strMeal": f"Stub Meal {i}", "strMealThumb": "",
+     "strCategory": "Seafood", "strArea": "British", "strInstructions": "Cook.",
+     "strIngredient1": "Salmon", "strIngredient2": ["Lemon", "Butter", "Dill"][i % 3]}
+    for i in range(6)
+]}
+
+
+def stub_upstream(latency):
+    """ASGI app standing in for TheMealDB, tracking its peak concurrency."""
+    stats = {"in_flight": 0, "peak": 0, "served": 0}
+    body = json.dumps(STUB_MEALS).encode()
+
+    async def stub(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        payload = body
+        if scope["path"] == "/stats":
+            payload = json.dumps(stats).encode()
+        elif scope["path"] == "/reset":
+            stats.update(peak=stats["in_flight"], served=0)
+        else:
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            try:
+                await asyncio.sleep(latency)
+            finally:
+                stats["in_flight"] -= 1
+            stats["served"] += 1
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": payload})
+
+    return stub
+
+
+def serve_sync(port, workers):
+    from werkzeug.serving import BaseWSGIServer
+
+    from app import app
+
+    class PooledWSGIServer(BaseWSGIServer):
+        request_queue_size = 4096
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.pool = ThreadPoolExecutor(workers)
+
+        def process_request(self, request, client_address):
+            self.pool.submit(self.process_request_thread, request, client_address)
+
+        def process_request_thread(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    PooledWSGIServer("127.0.0.1", port, app).serve_forever()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn(args, env=None):
+    return subprocess.Popen([sys.executable, *args], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def get(url, timeout=5):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def wait_until_up(url, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            get(url, timeout=1)
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{url} did not come up within {timeout}s")
+
+
+def warm_up(url, latency):
+    """Poll a detail page until similar meals appear, so no mode builds its index mid-run."""
+    # The sync mode fetches the 26 catalog letters one after another
+    timeout = 20 + 26 * latency * 2
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if b'class="meal-card-link"' in get(url, timeout=timeout):
+            return
+        time.sleep(0.1)
+    raise RuntimeError(f"similar meals did not appear on {url} within {timeout:.0f}s")
+
+
+async def load(url, total, concurrency):
+    latencies = []
+    errors = 0
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    timeout = aiohttp.ClientTimeout(total=120)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as client:
+        queue = iter(range(total))
+
+        async def worker():
+            nonlocal errors
+            for _ in queue:
+                start = time.perf_counter()
+                try:
+                    async with client.get(url) as response:
+                        body = await response.read()
+                    if response.status != 200 or b"Stub Meal" not in body:
+                        errors += 1
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return elapsed, latencies, errors
+
+
+def run_mode(name, server_args, stub_url, args):
+    port = free_port()
+    env = dict(os.environ, MEALDB_BASE_URL=f"{stub_url}/")
+    server = spawn([arg.format(port=port) for arg in server_args], env=env)
+    try:
+        wait_until_up(f"http://127.0.0.1:{port}/")
+        warm_up(f"http://127.0.0.1:{port}{WARMUP_PAGE}", args.latency)
+        get(f"{stub_url}/reset")
+        elapsed, latencies, errors = asyncio.run(
+            load(f"http://127.0.0.1:{port}{PAGE}", args.requests, args.concurrency))
+        peak = json.loads(get(f"{stub_url}/stats"))["peak"]
+    finally:
+        server.terminate()
+        server.wait()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:<24} {args.requests / elapsed:9.1f} req/s   p50 {p50 * 1000:7.0f} ms   "
+          f"p99 {p99 * 1000:7.0f} ms   peak upstream in flight {peak:4d}   errors {errors}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2, help="stub upstream delay in seconds")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=300)
+    parser.add_argument("--sync-workers", type=int, default=8)
+    parser.add_argument("--role", choices=["stub", "sync"], help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role == "stub":
+        import uvicorn
+        uvicorn.run(stub_upstream(args.latency), port=args.port, log_level="warning",
+                    backlog=4096)
+        return
+    if args.role == "sync":
+        sys.path.insert(0, ROOT)
+        serve_sync(args.port, args.sync_workers)
+        return
+
+    script = os.path.abspath(__file__)
+    stub_port = free_port()
+    stub_url = f"http://127.0.0.1:{stub_port}"
+    stub = spawn([script, "--role", "stub", "--port", str(stub_port), "--latency", str(args.latency)])
+    try:
+        wait_until_up(f"{stub_url}/stats")
+        print(f"upstream latency {args.latency * 1000:.0f} ms, {args.requests} requests, "
+              f"{args.concurrency} concurrent clients")
+        run_mode(f"sync ({args.sync_workers} workers)",
+                 [script, "--role", "sync", "--port", "{port}", "--sync-workers", str(args.sync_workers)],
+                 stub_url, args)
+        run_mode("async (1 process)",
+                 ["-m", "uvicorn", "asgi:app", "--port", "{port}", "--log-level", "warning",
+                  "--backlog", "4096"],
+                 stub_url, args)
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    main()
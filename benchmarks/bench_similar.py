@@ -0,0 +1,62 @@
+"""Time a full rebuild of the similar meals index on synthetic catalogs.
+
+Usage: python benchmarks/bench_similar.py [--meals 300 1000 3000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from similar import SimilarMealIndex  # noqa: E402
+
+# Roughly the shape of TheMealDB: a few hundred distinct ingredients, 5-20 per
+# meal, with a handful of staples (salt, oil, onion...) shared by most meals.
+VOCABULARY_SIZE = 600
+
+
+def synthetic_catalog(n_meals, seed=0):
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, VOCABULARY_SIZE + 1)
+    popularity /= popularity.sum()
+    meals = []
+    for i in range(n_meals):
+        count = rng.integers(5, 21)
+        picks = rng.choice(VOCABULARY_SIZE, size=count, replace=False, p=popularity)
+        meal = {"idMeal": str(50000 + i), "strMeal": f"Meal {i}", "strMealThumb": ""}
+        for slot, ingredient in enumerate(picks, start=1):
+            meal[f"strIngredient{slot}"] = f"Ingredient {ingredient}"
+        meals.append(meal)
+    return meals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meals", type=int, nargs="+", default=[300, 1000, 3000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for n_meals in args.meals:
+        catalog = synthetic_catalog(n_meals)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            index = SimilarMealIndex.build(catalog)
+            timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for meal in catalog:
+            index.similar_to(meal["idMeal"])
+        lookup = (time.perf_counter() - start) / n_meals
+
+        print(f"{n_meals:>6} meals: build best {min(timings) * 1000:8.1f} ms, "
+              f"median {sorted(timings)[len(timings) // 2] * 1000:8.1f} ms, "
+              f"lookup {lookup * 1e6:6.1f} us, "
+              f"index {index.neighbours.nbytes / 1024:7.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+from string import ascii_lowercase
+
+import numpy as np
+from scipy import sparse
+
+# Number of neighbours precomputed for every meal in the catalog
+TOP_K = 6
+# Rows of the similarity matrix materialised at once while ranking neighbours
+BLOCK_SIZE = 1024
+# Fields copied from the full meal record into the recommendation cards
+SUMMARY_FIELDS = ("idMeal", "strMeal", "strMealThumb", "strCategory", "strArea")
+# Seconds allowed for each upstream call while loading the catalog
+CATALOG_TIMEOUT = 10
+# Delay before retrying a failed catalog build, doubling up to the maximum
+RETRY_DELAY = 30
+RETRY_MAX_DELAY = 600
+
+
+class CatalogError(Exception):
+    """Raised when part of the catalog could not be fetched from TheMealDB."""
+
+
+def meal_ingredients(meal):
+    """Return the distinct, normalised ingredient names of a meal."""
+    ingredients = set()
+    for i in range(1, 21):
+        ingredient = meal.get(f"strIngredient{i}")
+        if ingredient and ingredient.strip():
+            ingredients.add(ingredient.strip().lower())
+    return ingredients
+
+
+class SimilarMealIndex:
+    """Top-k cosine neighbours of every meal, keyed by TF-IDF ingredient vectors.
+
+    The whole catalog is ranked once in `build`; afterwards `similar_to` is a
+    dictionary lookup plus a slice of the `neighbours` id array.
+    """
+
+    def __init__(self, meals, neighbours):
+        self.meals = meals
+        self.neighbours = neighbours
+        self._row_of = {meal["idMeal"]: row for row, meal in enumerate(meals)}
+
+    def __len__(self):
+        return len(self.meals)
+
+    @classmethod
+    def build(cls, meals, k=TOP_K):
+        meals = list({meal["idMeal"]: meal for meal in meals if meal.get("idMeal")}.values())
+        summaries = [{field: meal.get(field) for field in SUMMARY_FIELDS} for meal in meals]
+        if not meals:
+            return cls(summaries, np.empty((0, k), dtype=np.int32))
+
+        vocabulary = {}
+        indptr = [0]
+        indices = []
+        for meal in meals:
+            indices.extend(vocabulary.setdefault(name, len(vocabulary))
+                           for name in meal_ingredients(meal))
+            indptr.append(len(indices))
+
+        n_meals, n_terms = len(meals), len(vocabulary)
+        indices = np.asarray(indices, dtype=np.int32)
+        indptr = np.asarray(indptr, dtype=np.int32)
+
+        # Ingredients appear at most once per meal, so the term frequency is
+        # binary and each stored value is just the smoothed IDF of its column.
+        df = np.bincount(indices, minlength=n_terms)
+        idf = np.log((1 + n_meals) / (1 + df)) + 1
+        data = idf[indices].astype(np.float32)
+
+        vectors = sparse.csr_matrix((data, indices, indptr), shape=(n_meals, n_terms))
+        norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        vectors = sparse.diags(1 / norms).astype(np.float32) @ vectors
+        return cls(summaries, cls._rank(vectors, k))
+
+    @staticmethod
+    def _rank(vectors, k):
+        n_meals = vectors.shape[0]
+        k_eff = min(k, n_meals - 1)
+        neighbours = np.full((n_meals, k), -1, dtype=np.int32)
+        if k_eff <= 0:
+            return neighbours
+
+        # Shared staples make the score matrix nearly dense, so multiply each
+        # sparse block against a dense copy of the (small) ingredient space.
+        transposed = vectors.T.toarray()
+        for start in range(0, n_meals, BLOCK_SIZE):
+            stop = min(start + BLOCK_SIZE, n_meals)
+            scores = vectors[start:stop] @ transposed
+            rows = np.arange(stop - start)
+            scores[rows, rows + start] = -1  # a meal is never its own neighbour
+
+            top = np.argpartition(scores, -k_eff, axis=1)[:, -k_eff:]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top[np.take_along_axis(top_scores, order, axis=1) <= 0] = -1
+            neighbours[start:stop, :k_eff] = top
+        return neighbours
+
+    def similar_to(self, meal_id):
+        row = self._row_of.get(meal_id)
+        if row is None:
+            return []
+        return [self.meals[i] for i in self.neighbours[row] if i >= 0]
+
+
+def catalog_meals(results):
+    """Flatten the per-letter search results into one list of meals.
+
+    Raises CatalogError if any letter failed, so a partial catalog is never indexed.
+    """
+    failed = [letter for letter, data in zip(ascii_lowercase, results) if "error" in data]
+    if failed:
+        raise CatalogError(f"Failed to fetch meals for letters: {', '.join(failed)}")
+    return [meal for data in results for meal in data.get("meals") or []]
+
+
+def load_catalog(fetch):
+    """Collect every full meal record using `fetch(endpoint, params, timeout)`."""
+    return catalog_meals([fetch("search.php", params={"f": letter}, timeout=CATALOG_TIMEOUT)
+                          for letter in ascii_lowercase])
+
+
+async def load_catalog_async(fetch):
+    """Like `load_catalog`, awaiting an async `fetch` for all letters at once."""
+    return catalog_meals(await asyncio.gather(
+        *(fetch("search.php", params={"f": letter}, timeout=CATALOG_TIMEOUT)
+          for letter in ascii_lowercase)))
+
+
+_index = None
+_building = False
+_failures = 0
+_retry_at = 0.0
+_state_lock = threading.Lock()
+
+
+def claim_build():
+    """Return True if the caller should start a build now.
+
+    False while the index exists, another build is running, or a failed
+    build is still backing off. A True result must be followed by `finish_build`.
+    """
+    global _building
+    with _state_lock:
+        if _index is not None or _building or time.monotonic() < _retry_at:
+            return False
+        _building = True
+        return True
+
+
+def finish_build(index):
+    """Store a freshly built index, or schedule a retry if `index` is None."""
+    global _index, _building, _failures, _retry_at
+    with _state_lock:
+        _building = False
+        if index is None:
+            _failures += 1
+            delay = min(RETRY_MAX_DELAY, RETRY_DELAY * 2 ** (_failures - 1))
+            _retry_at = time.monotonic() + delay
+        else:
+            _index = index
+            _failures = 0
+
+
+def build_index(fetch):
+    index = None
+    try:
+        index = SimilarMealIndex.build(load_catalog(fetch))
+    except CatalogError:
+        pass
+    finally:
+        finish_build(index)
+
+
+def get_index(fetch):
+    """Return the shared index, or None until a background build has finished."""
+    if claim_build():
+        threading.Thread(target=build_index, args=(fetch,), daemon=True).start()
+    return _index
+
+
+def current_index():
+    """Return the shared index, or None if it has not been built yet."""
+    return _index